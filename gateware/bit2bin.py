@@ -17,15 +17,12 @@
 
 import struct
 
+import numpy as np
+
 
 def flip32(data):
-    sl = struct.Struct("<I")
-    sb = struct.Struct(">I")
-    b = memoryview(data)
-    d = bytearray(len(data))
-    for offset in range(0, len(data), sl.size):
-        sb.pack_into(d, offset, *sl.unpack_from(b, offset))
-    return d
+    """Swap the byte order of each 32-bit word."""
+    return np.frombuffer(data, dtype="<u4").byteswap().tobytes()
 
 
 def bit2bin(bit, bin, flip=False):
@@ -14,6 +14,6 @@ fi
 
 export PATH=$VIVADOPATH:$PATH
 
-rm linien-server/linien_server/linien.bin -f
 # run with -m option to avoid errors related to relative imports without breaking pytest
-python3 -m gateware.fpga_image_helper
\ No newline at end of file
+# the build is skipped if the gateware sources didn't change, pass --force to rebuild
+python3 -m gateware.fpga_image_helper "$@"
\ No newline at end of file
@@ -18,6 +18,10 @@
 
 # this file compiles the FPGA image. You shouldn't call it directly though but
 # use `build_fpga_image.sh`
+import argparse
+import hashlib
+import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 REPO_ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -26,54 +30,131 @@ from .bit2bin import bit2bin
 from .hw_platform import Platform
 from .linien_module import RootModule
 
+CSRMAP_TEMPLATE = """\
+csr_constants = {{
+{constants}}}
 
-def py_csrconstants(map, fil):
-    fil.write("csr_constants = {\n")
-    for k, v in root.linien.csrbanks.constants:
-        fil.write("    '{}_{}': {},\n".format(k, v.name, v.value.value))
-    fil.write("}\n\n")
+csr = {{
+{csr}}}
+states = {states}
+signals = {signals}
+"""
+
+
+def py_csrconstants(constants):
+    line = "    '{}_{}': {},\n".format
+    return "".join([line(k, v.name, v.value.value) for k, v in constants])
 
 
 def get_csrmap(banks):
     for name, csrs, map_addr, rmap in banks:
         reg_addr = 0
         for csr in csrs:
-            yield [
+            yield (
                 name,
                 csr.name,
                 map_addr,
                 reg_addr,
                 csr.size,
                 not hasattr(csr, "status"),
-            ]
-            reg_addr += (csr.size + 8 - 1) // 8
+            )
+            reg_addr += -(-csr.size // 8)
+
+
+def py_csrmap(it):
+    line = "    '{}_{}': ({}, 0x{:03x}, {}, {}),\n".format
+    return "".join([line(*reg) for reg in it])
+
+
+def render_csrmap(linien):
+    """Render the content of `csrmap.py` for a `LinienModule` in a single pass."""
+    return CSRMAP_TEMPLATE.format(
+        constants=py_csrconstants(linien.csrbanks.constants),
+        csr=py_csrmap(get_csrmap(linien.csrbanks.banks)),
+        states=repr(linien.state_names),
+        signals=repr(linien.signal_names),
+    )
+
+
+def package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
 
 
-def py_csrmap(it, fil):
-    fil.write("csr = {\n")
-    for reg in it:
-        fil.write("    '{}_{}': ({}, 0x{:03x}, {}, {}),\n".format(*reg))
-    fil.write("}\n")
+def source_hash(csrmap, build_dir):
+    """
+    Hash of everything the bitstream depends on: the gateware sources, the other
+    modules of the repository imported while building it (e.g. `linien_common`), the
+    versions of migen and misoc and the resulting CSR map.
+    """
+    gateware_dir = REPO_ROOT_DIR / "gateware"
+    paths = {
+        *gateware_dir.glob("**/*.py"),
+        *(gateware_dir / "verilog").iterdir(),
+        REPO_ROOT_DIR / "linien-common" / "linien_common" / "common.py",
+    }
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file is not None:
+            module_path = Path(module_file).resolve()
+            if REPO_ROOT_DIR in module_path.parents:
+                paths.add(module_path)
+    h = hashlib.blake2b()
+    for path in sorted(paths):
+        if build_dir in path.parents:
+            continue
+        h.update(str(path.relative_to(REPO_ROOT_DIR)).encode())
+        h.update(path.read_bytes())
+    for name in ("migen", "misoc"):
+        h.update(("%s %s" % (name, package_version(name))).encode())
+    h.update(csrmap.encode())
+    return h.hexdigest()
+
+
+def file_hash(path):
+    return hashlib.blake2b(path.read_bytes()).hexdigest()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Linien FPGA image")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild from scratch even if the gateware sources didn't change",
+    )
+    args = parser.parse_args()
+
     platform = Platform()
     root = RootModule(platform)
 
-    with open(
-        REPO_ROOT_DIR / "linien-server" / "linien_server" / "csrmap.py", "w"
-    ) as fil:
-        py_csrconstants(root.linien.csrbanks.constants, fil)
-        csr = get_csrmap(root.linien.csrbanks.banks)
-        py_csrmap(csr, fil)
-        fil.write("states = {}\n".format(repr(root.linien.state_names)))
-        fil.write("signals = {}\n".format(repr(root.linien.signal_names)))
-
-    platform.add_source_dir(REPO_ROOT_DIR / "gateware" / "verilog")
+    csrmap = render_csrmap(root.linien)
+    csrmap_file = REPO_ROOT_DIR / "linien-server" / "linien_server" / "csrmap.py"
     build_dir = REPO_ROOT_DIR / "gateware" / "build"
-    platform.build(root, build_name="top", build_dir=build_dir)
-    bit2bin(
-        build_dir / "top.bit",
-        REPO_ROOT_DIR / "linien-server" / "linien_server" / "linien.bin",
-        flip=True,
-    )
+    bin_file = REPO_ROOT_DIR / "linien-server" / "linien_server" / "linien.bin"
+    # contains the hash of the sources and the hash of the `linien.bin` built from them
+    hash_file = build_dir / ".source.hash"
+    new_source_hash = source_hash(csrmap, build_dir)
+
+    if (
+        not args.force
+        and bin_file.exists()
+        and hash_file.exists()
+        and hash_file.read_text().split() == [new_source_hash, file_hash(bin_file)]
+    ):
+        print("Gateware sources didn't change, skipping build.")
+    else:
+        # If the build fails, neither an outdated bitstream nor a hash matching it must
+        # be left behind. The CSR map is only updated once the bitstream is there.
+        hash_file.unlink(missing_ok=True)
+        bin_file.unlink(missing_ok=True)
+        platform.add_source_dir(REPO_ROOT_DIR / "gateware" / "verilog")
+        # a forced build shouldn't reuse anything from the previous one
+        platform.toolchain.use_incremental = not args.force
+        platform.build(root, build_name="top", build_dir=build_dir)
+        bit2bin(build_dir / "top.bit", bin_file, flip=True)
+        hash_file.write_text("%s\n%s\n" % (new_source_hash, file_hash(bin_file)))
+
+    with open(csrmap_file, "w") as fil:
+        fil.write(csrmap)
@@ -17,6 +17,9 @@
 # You should have received a copy of the GNU General Public License
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+from pathlib import Path
+
 from migen.build.generic_platform import (
     ConstraintError,
     Drive,
@@ -26,6 +29,7 @@ from migen.build.generic_platform import (
     Subsignal,
 )
 from migen.build.xilinx import XilinxPlatform
+from migen.build.xilinx.vivado import XilinxVivadoToolchain
 
 # https://github.com/RedPitaya/RedPitaya/blob/master/FPGA/release1/fpga/code/red_pitaya.xdc
 
@@ -165,12 +169,61 @@ _io += [
 ]
 
 
+class IncrementalVivadoToolchain(XilinxVivadoToolchain):
+    """
+    Vivado toolchain that uses the routed checkpoint of the previous build (if there is
+    one) as reference for incremental implementation. Placement and routing of the
+    parts of the design that didn't change (e.g. PS, clocking, XADC) are reused
+    instead of being redone from scratch.
+
+    Out-of-context synthesis of these blocks is not possible as migen flattens the
+    design into a single verilog module.
+
+    Set `use_incremental` to `False` for a clean implementation from scratch.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.use_incremental = True
+
+    def _build_batch(self, platform, sources, edifs, ips, build_name):
+        # This relies on migen's (0.9.2) private `_build_batch` writing the complete
+        # batch script to `<build_name>.tcl` in the build directory (the current
+        # working directory), with `opt_design` on a line of its own right before
+        # `place_design` and the routed design saved as `<build_name>_route.dcp`.
+        super()._build_batch(platform, sources, edifs, ips, build_name)
+        if not self.use_incremental:
+            return
+        tcl_file = Path(build_name + ".tcl")
+        lines = tcl_file.read_text().split("\n")
+        if "opt_design" not in lines:
+            raise RuntimeError(
+                "Can't set up incremental implementation: no opt_design step in %s"
+                % tcl_file
+            )
+        idx = lines.index("opt_design") + 1
+        lines[idx:idx] = [
+            "if {{[file exists {0}_route.dcp]}} {{".format(build_name),
+            "    file copy -force {0}_route.dcp {0}_reference.dcp".format(build_name),
+            "    read_checkpoint -incremental {0}_reference.dcp".format(build_name),
+            "}",
+        ]
+        tcl_file.write_text("\n".join(lines))
+
+
 class Platform(XilinxPlatform):
     default_clk_name = "clk125"
     default_clk_period = 8.0
 
     def __init__(self):
         XilinxPlatform.__init__(self, "xc7z010-clg400-1", _io, toolchain="vivado")
+        self.toolchain = IncrementalVivadoToolchain()
+        # migen runs vivado in non-project mode where `-jobs` is not available; the
+        # number of threads used by synthesis and implementation is set with
+        # `general.maxThreads` instead (vivado accepts at most 8)
+        self.toolchain.pre_synthesis_commands.append(
+            "set_param general.maxThreads {}".format(min(os.cpu_count() or 1, 8))
+        )
         self.toolchain.pre_synthesis_commands.append(
             "read_xdc -ref processing_system7_v5_4_processing_system7 ../verilog/system_processing_system7_0_0.xdc"  # noqa: E501
         )
@@ -51,6 +51,18 @@ from .lowlevel.scopegen import ScopeGen
 from .lowlevel.xadc import XADC
 
 
+def add_csr_interconnect(module, address_map):
+    """
+    Collects the CSRs of `module` in CSR banks with addresses given by `address_map`
+    and connects them to a new `Sys2CSR` bridge at `module.sys2csr`.
+    """
+    module.submodules.csrbanks = csr_bus.CSRBankArray(module, address_map)
+    module.submodules.sys2csr = Sys2CSR()
+    module.submodules.csrcon = csr_bus.Interconnect(
+        module.sys2csr.csr, module.csrbanks.get_buses()
+    )
+
+
 class LinienLogic(Module, AutoCSR):
     def __init__(self, width=14, signal_width=25, chain_factor_width=8, coeff_width=25):
         self.init_csr(width, chain_factor_width)
@@ -210,8 +222,6 @@ class LinienModule(Module, AutoCSR):
             offset_signal=self.logic.chain_b_offset_signed,
         )
 
-        _ = ClockDomainsRenamer("sys_slow")
-        sys_double = ClockDomainsRenamer("sys_double")
         max_decimation = 16
         self.submodules.decimate = sys_double(Decimate(max_decimation))
         self.clock_domains.cd_decimated_clock = ClockDomain()
@@ -245,16 +255,12 @@ class LinienModule(Module, AutoCSR):
             "logic": 8,
         }
 
-        self.submodules.csrbanks = csr_bus.CSRBankArray(
+        add_csr_interconnect(
             self,
             lambda name, mem: csr_map[
                 name if mem is None else name + "_" + mem.name_override
             ],
         )
-        self.submodules.sys2csr = Sys2CSR()
-        self.submodules.csrcon = csr_bus.Interconnect(
-            self.sys2csr.csr, self.csrbanks.get_buses()
-        )
         self.submodules.syscdc = SysCDC()
         self.comb += self.syscdc.target.connect(self.sys2csr.sys)
 
@@ -423,11 +429,7 @@ class DummyID(Module, AutoCSR):
 class DummyHK(Module, AutoCSR):
     def __init__(self):
         self.submodules.id = DummyID()
-        self.submodules.csrbanks = csr_bus.CSRBankArray(self, lambda name, mem: 0)
-        self.submodules.sys2csr = Sys2CSR()
-        self.submodules.csrcon = csr_bus.Interconnect(
-            self.sys2csr.csr, self.csrbanks.get_buses()
-        )
+        add_csr_interconnect(self, lambda name, mem: 0)
         self.sys = self.sys2csr.sys
 
 
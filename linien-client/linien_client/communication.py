@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from linien_common.influxdb import InfluxDBCredentials
 from typing_extensions import Protocol
@@ -31,12 +31,31 @@ class LinienControlService(Protocol):
     def exposed_set_param(self, param_name: str, value: bytes) -> None:
         ...
 
+    def exposed_get_param_scalar(
+        self, param_name: str
+    ) -> Union[bool, int, float, bytes]:
+        ...
+
+    def exposed_set_param_scalar(
+        self, param_name: str, value: Union[bool, int, float]
+    ) -> None:
+        ...
+
+    def exposed_set_params_bulk(self, values: bytes) -> None:
+        ...
+
     def exposed_reset_param(self, param_name: str) -> None:
         ...
 
     def exposed_init_parameter_sync(self, uuid: str) -> bytes:
         ...
 
+    def exposed_get_parameter_schema(self) -> bytes:
+        ...
+
+    def exposed_init_parameter_values(self, uuid: str) -> bytes:
+        ...
+
     def exposed_register_remote_listener(self, uuid: str, param_name: str) -> None:
         ...
 
@@ -45,6 +64,9 @@ class LinienControlService(Protocol):
     ) -> None:
         ...
 
+    def exposed_enable_msgpack(self, uuid: str) -> None:
+        ...
+
     def exposed_get_changed_parameters_queue(self, uuid: str) -> bytes:
         ...
 
@@ -16,14 +16,24 @@
 # You should have received a copy of the GNU General Public License
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
-
-from linien_common.communication import pack, unpack
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import msgpack
+from linien_common.communication import (
+    SCALAR_TYPES,
+    pack,
+    unpack,
+    unpack_changed_parameters,
+)
 from rpyc import async_
 from rpyc.core.async_ import AsyncResult
 
 from .communication import LinienControlService
 
+# Marks a `RemoteParameter` whose value has not been cached (yet).
+_UNSET = object()
+
 
 class RemoteParameter:
     """A helper class for `RemoteParameters`, representing a single remote parameter."""
@@ -36,6 +46,7 @@ class RemoteParameter:
         restorable: bool,
         loggable: bool,
         log: bool,
+        scalar: bool = False,
     ):
         self.name = name
         self.parent = parent
@@ -43,17 +54,32 @@ class RemoteParameter:
         self.restorable = restorable
         self.loggable = loggable
         self.log = log
+        # Whether the parameter holds a builtin scalar (see `SCALAR_TYPES`) that can be
+        # transferred without pickling. Decided once based on the initial value.
+        self._scalar = scalar
+        self._cached_value: Any = _UNSET
 
     @property
     def value(self) -> Any:
         """Return the locally cached value (if it exists). Otherwise ask the server."""
-        if hasattr(self, "_cached_value"):
-            return self._cached_value
+        cached_value = self._cached_value
+        if cached_value is not _UNSET:
+            return cached_value
+        if self._scalar:
+            value = self.parent.remote.exposed_get_param_scalar(self.name)
+            if type(value) in SCALAR_TYPES:
+                return value
+            return unpack(value)
         return unpack(self.parent.remote.exposed_get_param(self.name))
 
     @value.setter
     def value(self, value: Any):
         """Notify the server of the new value"""
+        if self.parent._batch_buffer is not None:
+            self.parent._batch_buffer.append((self.name, value))
+            return
+        if self._scalar and type(value) in SCALAR_TYPES:
+            return self.parent.remote.exposed_set_param_scalar(self.name, value)
         return self.parent.remote.exposed_set_param(self.name, pack(value))
 
     @property
@@ -89,6 +115,9 @@ class RemoteParameter:
 
 
 class RemoteParameters:
+    # Set at the end of `__init__`, afterwards parameters can't be overwritten.
+    _attributes_locked = False
+
     def __init__(self, remote: LinienControlService, uuid: str, use_cache: bool):
         """
         Provides access to a remote `Parameters` instance and minics its functionality.
@@ -107,12 +136,18 @@ class RemoteParameters:
 
         self._async_changed_parameters_queue: Union[AsyncResult, None] = None
         self._async_listener_registering: Union[AsyncResult, None] = None
+        # asynchronous versions of the remote methods used for polling
+        self._async_get_queue = async_(self.remote.exposed_get_changed_parameters_queue)
+        self._async_register = async_(self.remote.exposed_register_remote_listeners)
 
         self._listeners_pending_remote_registration: List[str] = []
         self._callbacks: Dict[str, List[Callable]] = {}
+        # Collects `(name, value)` pairs while inside a `batch` block.
+        self._batch_buffer: Optional[List[Tuple[str, Any]]] = None
 
         # mimic functionality of `parameters.Parameters`:
-        all_parameters = unpack(self.remote.exposed_init_parameter_sync(self.uuid))
+        all_parameters = self._init_parameter_sync()
+        param_list: List[Tuple[str, RemoteParameter]] = []
         for name, value, can_be_cached, restorable, loggable, log in all_parameters:
             param = RemoteParameter(
                 parent=self,
@@ -121,32 +156,74 @@ class RemoteParameters:
                 restorable=restorable,
                 loggable=loggable,
                 log=log,
+                scalar=type(value) in SCALAR_TYPES,
             )
             setattr(self, name, param)
+            param_list.append((name, param))
             if param.use_cache:
                 param.update_cache(value)
+        # parameters don't change after initialization, so `__iter__` can use this
+        self._param_list = tuple(param_list)
+        self._params_by_name: Dict[str, RemoteParameter] = dict(param_list)
         self._attributes_locked = True
 
+        self.remote.exposed_enable_msgpack(self.uuid)
+
         self.check_for_changed_parameters()
 
+    def _init_parameter_sync(self) -> List[Tuple[str, Any, bool, bool, bool, bool]]:
+        """
+        Retrieve names, properties and values of all parameters from the server. The
+        static part (schema) and the values are transferred separately.
+        """
+        schema = msgpack.unpackb(self.remote.exposed_get_parameter_schema())
+        values = unpack(self.remote.exposed_init_parameter_values(self.uuid))
+        return [
+            (name, value, can_be_cached, restorable, loggable, log)
+            for (name, can_be_cached, restorable, loggable), (value, log) in zip(
+                schema, values
+            )
+        ]
+
     def __iter__(self) -> Iterator[Tuple[str, "RemoteParameter"]]:
-        for param_name, param in self.__dict__.items():
-            if isinstance(param, RemoteParameter):
-                yield param_name, param
+        return iter(self._param_list)
 
     def __setattr__(self, name: str, value: Any) -> None:
         # Prevents accidentally overwriting parameters.
-        if (
-            hasattr(self, "_attributes_locked")
-            and self._attributes_locked
-            and not name.startswith("_")
-        ):
+        if self._attributes_locked and not name.startswith("_"):
             raise AttributeError(
                 "Parameters are locked! Did you mean to set the value of this parameter"
                 f" instead, i.e. parameters.{name}.value = {value}"
             )
         super().__setattr__(name, value)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager that collects all parameter changes and sends them to the
+        server in a single call when the block is left, e.g.
+
+            with parameters.batch():
+                parameters.modulation_amplitude.value = 0.5 * Vpp
+                parameters.modulation_frequency.value = 10 * MHz
+
+        Values are applied on the server in the order in which they were set. If the
+        block raises an exception, the collected changes are discarded.
+        """
+        if self._batch_buffer is not None:
+            # already batching, changes are sent by the outermost block
+            yield
+            return
+
+        self._batch_buffer = []
+        try:
+            yield
+            buffer = self._batch_buffer
+        finally:
+            self._batch_buffer = None
+        if buffer:
+            self.remote.exposed_set_params_bulk(pack(buffer))
+
     def check_for_changed_parameters(self) -> None:
         """
         Ask the server for changed parameters and trigger the respective callbacks.
@@ -166,9 +243,7 @@ class RemoteParameters:
             # call to `check_for_changed_parameters` will then check whether the result
             # is ready. Issues an asynchronous call (that does not block the GUI) to the
             # server in order to retrieve a batch of changed parameters.
-            self._async_changed_parameters_queue = async_(
-                self.remote.exposed_get_changed_parameters_queue
-            )(self.uuid)
+            self._async_changed_parameters_queue = self._async_get_queue(self.uuid)
 
         if self._async_listener_registering is None:
             # Issues an asynchronous call to the server containing all the parameters
@@ -178,9 +253,9 @@ class RemoteParameters:
                 # This copies the list before clearing it below. Otherwise we just
                 # transmit an empty list in the async call
                 pending = pending[:]
-                self._async_listener_registering = async_(
-                    self.remote.exposed_register_remote_listeners
-                )(self.uuid, pending)
+                self._async_listener_registering = self._async_register(
+                    self.uuid, pending
+                )
                 self._listeners_pending_remote_registration.clear()
 
         if (
@@ -188,26 +263,27 @@ class RemoteParameters:
             and self._async_changed_parameters_queue.ready
         ):
             # We have a result.
-            queue: List[Tuple[str, Any]] = unpack(
+            queue: List[Tuple[str, Any]] = unpack_changed_parameters(
                 self._async_changed_parameters_queue.value
             )
 
             # Now that we have our result, we can start the next call.
-            self._async_changed_parameters_queue = async_(
-                self.remote.exposed_get_changed_parameters_queue
-            )(self.uuid)
+            self._async_changed_parameters_queue = self._async_get_queue(self.uuid)
 
             # Before calling listeners, we update cache for all received parameters at
             # once.
+            params_by_name = self._params_by_name
             for param_name, value in queue:
-                param: RemoteParameter = getattr(self, param_name)
+                param = params_by_name[param_name]
                 if param.use_cache:
                     param.update_cache(value)
 
             # Iterate over all canged parameters and call respective callback functions.
+            callbacks = self._callbacks
             for param_name, value in queue:
-                if param_name in self._callbacks:
-                    for callback in self._callbacks[param_name]:
+                param_callbacks = callbacks.get(param_name)
+                if param_callbacks:
+                    for callback in param_callbacks:
                         callback(value)
 
         if (
@@ -40,6 +40,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "fabric>=2.7.0",
+        "msgpack>=1.0.0",
         "numpy>=1.22",
         "patchwork>=1.0.1",
         "scipy>=1.4.1",
@@ -188,10 +188,16 @@ def determine_shift_by_correlation(zoom_factor, reference_signal, error_signal):
     zoomed_ref = zoomed_ref[::skip_factor]
 
     # now sample the error signal down to the same length as the zoomed
-    # reference signal
-    downsampled_error_signal = resample(error_signal, len(zoomed_ref))
+    # reference signal. Without zoom, the lengths usually match already and the FFTs
+    # of `resample` can be skipped.
+    if len(zoomed_ref) == length:
+        downsampled_error_signal = error_signal
+    else:
+        downsampled_error_signal = resample(error_signal, len(zoomed_ref))
 
-    correlation = correlate(zoomed_ref, downsampled_error_signal)
+    # for signals of this length, the heuristic of `correlate` chooses the direct
+    # method although the FFT-based one is considerably faster
+    correlation = correlate(zoomed_ref, downsampled_error_signal, method="fft")
 
     if check_whether_correlation_is_bad(correlation, len(zoomed_ref)):
         raise SpectrumUncorrelatedException()
@@ -18,14 +18,19 @@
 import hashlib
 import pickle
 from socket import socket
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
+import msgpack
 from rpyc.utils.authenticators import AuthenticationError
 
 from .config import USER_DATA_PATH
 
 HASH_FILE_NAME = "auth_hash.txt"
 
+# Builtin types that rpyc transfers natively. Values of these types don't have to be
+# pickled when they are sent between client and server.
+SCALAR_TYPES = (bool, int, float)
+
 
 def pack(value: Any) -> bytes:
     try:
@@ -45,6 +50,34 @@ def unpack(value: Any) -> Any:
         return value
 
 
+def pack_changed_parameters(queue: List[Tuple[str, Any]], use_msgpack: bool) -> bytes:
+    """
+    Serialize a queue of changed parameters, i.e. a list of `(name, value)` tuples.
+
+    If `use_msgpack` is set, msgpack is used as long as all values have types that
+    msgpack supports natively (no subclasses like enums, no tuples). Otherwise, the
+    queue is pickled.
+    """
+    if use_msgpack:
+        names = [name for name, _ in queue]
+        values = [value for _, value in queue]
+        try:
+            return msgpack.packb([names, values], use_bin_type=True, strict_types=True)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return pack(queue)
+
+
+def unpack_changed_parameters(data: bytes) -> List[Tuple[str, Any]]:
+    """Deserialize a queue packed with `pack_changed_parameters`."""
+    # pickled data always starts with the PROTO opcode, msgpack data never does
+    if isinstance(data, bytes) and data[:1] != pickle.PROTO:
+        # values may be dicts with non-str keys which msgpack rejects by default
+        names, values = msgpack.unpackb(data, raw=False, strict_map_key=False)
+        return list(zip(names, values))
+    return unpack(data)
+
+
 def hash_username_and_password(username: str, password: str) -> str:
     return hashlib.sha256((username + "/" + password).encode()).hexdigest()
 
@@ -37,6 +37,7 @@ setup(
     python_requires=">=3.5",
     install_requires=[
         "importlib_metadata>=2.1.3",
+        "msgpack>=1.0.0",
         "numpy>=1.11.0",
         "rpyc>=4.0,<5.0",
         "scipy>=0.17.0",
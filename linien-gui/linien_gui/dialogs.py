@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Callable
+from typing import Callable, List
 
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
@@ -38,6 +38,13 @@ class SSHCommandOutputWidget(QListWidget):
     def __init__(self, parent: QWidget):
         super(SSHCommandOutputWidget, self).__init__(parent)
         self.setSelectionMode(self.NoSelection)
+        # Output arrives in bursts. Instead of adding and scrolling for every line,
+        # lines are collected and added at once per burst by this timer.
+        self._pending_lines: List[str] = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self.flush_pending_lines)
 
     def run(self, thread):
         self.thread = thread
@@ -46,12 +53,20 @@ class SSHCommandOutputWidget(QListWidget):
         self.thread.start()
 
     def on_new_item_in_out_stream(self, line: str):
-        self.addItem(line.rstrip())
-        self.scrollToBottom()
+        self._pending_lines.append(line.rstrip())
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending_lines(self):
+        if self._pending_lines:
+            self.addItems(self._pending_lines)
+            self._pending_lines = []
+            self.scrollToBottom()
 
     def on_thread_finished(self):
-        self.addItem("\nFinished.")
-        self.scrollToBottom()
+        self._flush_timer.stop()
+        self._pending_lines.append("\nFinished.")
+        self.flush_pending_lines()
         self.command_finished.emit()
 
 
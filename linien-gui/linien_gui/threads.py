@@ -50,8 +50,10 @@ class RemoteServerInstallationThread(QThread):
         """A thread that installs the linien server on a remote machine."""
         super(RemoteServerInstallationThread, self).__init__()
         self.device = device
-
-    out_stream = RemoteOutStream()
+        # Output of the installation is pushed to `SSHCommandOutputWidget` via the
+        # `new_item` signal. Every thread needs its own stream, otherwise output is also
+        # sent to the widgets of previous installations.
+        self.out_stream = RemoteOutStream()
 
     def run(self):
         install_remote_server(
@@ -145,21 +147,23 @@ class ConnectionThread(QThread):
 
         differences = False
 
-        for k, v in params.items():
-            if hasattr(self.client.parameters, k):
-                param = getattr(self.client.parameters, k)
-                if param.value != v:
-                    if dry_run:
-                        print("parameter", k, "differs")
-                        differences = True
-                        break
-                    else:
-                        param.value = v
-            else:
-                # This may happen if the settings were written with a different version
-                # of linien.
-                print(f"Unable to restore parameter {k}. Delete the cached value.")
-                save_parameter(self.device["key"], k, None, delete=True)
+        # all values are uploaded to the server in a single call
+        with self.client.parameters.batch():
+            for k, v in params.items():
+                if hasattr(self.client.parameters, k):
+                    param = getattr(self.client.parameters, k)
+                    if param.value != v:
+                        if dry_run:
+                            print("parameter", k, "differs")
+                            differences = True
+                            break
+                        else:
+                            param.value = v
+                else:
+                    # This may happen if the settings were written with a different
+                    # version of linien.
+                    print(f"Unable to restore parameter {k}. Delete the cached value.")
+                    save_parameter(self.device["key"], k, None, delete=True)
 
         if not dry_run:
             self.client.control.write_registers()
@@ -16,14 +16,16 @@
 # You should have received a copy of the GNU General Public License
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import pickle
 import shutil
 import subprocess
+from collections import deque
 from pathlib import Path
 from random import random
 from threading import Event, Thread
 from time import sleep
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
 
 import numpy as np
 from linien_common.common import DECIMATION, MAX_N_POINTS, N_POINTS
@@ -31,7 +33,8 @@ from linien_common.config import ACQUISITION_PORT
 from linien_server.csr import PythonCSR
 from pyrp3.board import RedPitaya  # type: ignore
 from pyrp3.instrument import TriggerSource  # type: ignore
-from rpyc import Service
+from rpyc import Service, async_
+from rpyc.core.netref import BaseNetref
 from rpyc.utils.server import ThreadedServer
 
 
@@ -43,13 +46,17 @@ class AcquisitionService(Service):
 
         self.red_pitaya = RedPitaya()
         self.csr = PythonCSR(self.red_pitaya)
-        self.csr_queue = []
-        self.csr_iir_queue = []
+        # Register writes are applied by the acquisition thread in the order in which
+        # they were requested. Every entry consists of the method that does the write
+        # and its arguments.
+        self.csr_queue: Deque[Tuple[Callable[..., Any], Tuple[Any, ...]]] = deque()
 
         self.data = pickle.dumps(None)
         self.data_was_raw = False
         self.data_hash = None
         self.data_uuid = None
+        # called with every new data set, see `exposed_register_data_callback`
+        self.data_callback: Optional[Callable[..., Any]] = None
 
         self.locked = False
         self.exposed_set_sweep_speed(9)
@@ -86,12 +93,8 @@ class AcquisitionService(Service):
     ) -> None:
         while not stop_event.is_set():
             while self.csr_queue:
-                key, value = self.csr_queue.pop(0)
-                self.csr.set(key, value)
-
-            while self.csr_iir_queue:
-                args = self.csr_iir_queue.pop(0)
-                self.csr.set_iir(*args)
+                write, args = self.csr_queue.popleft()
+                write(*args)
 
             if self.locked and not self.confirmed_that_in_lock:
                 self.confirmed_that_in_lock = self.csr.get(
@@ -135,6 +138,7 @@ class AcquisitionService(Service):
                     self.data = pickle.dumps(data)
                 self.data_was_raw = is_raw
                 self.data_hash = random()
+                self._push_data()
 
             self.program_acquisition_and_rearm()
 
@@ -252,6 +256,32 @@ class AcquisitionService(Service):
         else:
             return True, self.data_hash, self.data_was_raw, self.data, self.data_uuid
 
+    def exposed_register_data_callback(
+        self, callback: Callable[[bool, bytes, Optional[float]], Any]
+    ) -> None:
+        """
+        Register a callback that is called with `(is_raw, data, uuid)` from the
+        acquisition thread whenever a new data set was recorded.
+        """
+        if isinstance(callback, BaseNetref):
+            # don't block the acquisition while the remote side handles the data
+            callback = async_(callback)
+        self.data_callback = callback
+
+    def _push_data(self) -> None:
+        # The callback may be replaced from another thread at any time. Looking it up
+        # only once ensures that the same callback is checked, called and, if its
+        # connection was closed, removed.
+        callback = self.data_callback
+        if callback is None:
+            return
+        try:
+            callback(self.data_was_raw, self.data, self.data_uuid)
+        except EOFError:
+            print("Connection of data callback closed, removing it.")
+            if self.data_callback is callback:
+                self.data_callback = None
+
     def exposed_set_sweep_speed(self, speed):
         self.sweep_speed = speed
         # if a slow acqisition is currently running and we change the sweep speed we
@@ -273,10 +303,14 @@ class AcquisitionService(Service):
         self.dual_channel = dual_channel
 
     def exposed_set_csr(self, key: str, value: int) -> None:
-        self.csr_queue.append((key, value))
+        self.csr_queue.append((self.csr.set, (key, value)))
+
+    def exposed_set_csrs(self, values: Tuple[Tuple[str, int], ...]) -> None:
+        """Queue several register writes given as `(key, value)` pairs at once."""
+        self.csr_queue.extend((self.csr.set, key_value) for key_value in values)
 
     def exposed_set_iir_csr(self, *args):
-        self.csr_iir_queue.append(args)
+        self.csr_queue.append((self.csr.set_iir, args))
 
     def exposed_stop_acquisition(self) -> None:
         self.stop_event.set()
@@ -315,12 +349,32 @@ def flash_fpga():
 
     if fpga_dev_file.exists():
         print("Copying gateware to %s" % fpga_dev_file)
-        shutil.copy(str(filepath), str(fpga_dev_file))
+        with open(str(filepath), "rb") as src, open(str(fpga_dev_file), "wb") as dst:
+            copy_to_device(src, dst)
     else:
         print("Using fpautil to deploy gateware.")
         subprocess.Popen(["/opt/redpitaya/bin/fpgautil", "-b", str(filepath)]).wait()
 
 
+def copy_to_device(src, dst):
+    """
+    Copy the content of the file object `src` to `dst` using `os.sendfile`, i.e.
+    without passing the data through user space. If the device does not support
+    this, fall back to a regular copy.
+    """
+    size = os.fstat(src.fileno()).st_size
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        src.seek(offset)
+        shutil.copyfileobj(src, dst)
+
+
 def start_nginx():
     subprocess.Popen(["systemctl", "start", "redpitaya_nginx.service"])
 
@@ -23,6 +23,7 @@ with warnings.catch_warnings():
     warnings.simplefilter("ignore")
     import cma
 
+import numpy as np
 from linien_common.common import MHz, Vpp
 from linien_server.optimization.utils import (
     FINAL_ZOOM_FACTOR,
@@ -31,6 +32,15 @@ from linien_server.optimization.utils import (
 )
 
 
+def get_bounds_min_and_span(bounds):
+    """
+    Return the lower bounds and the widths of the intervals given as `[min, max]`
+    pairs in `bounds` as arrays.
+    """
+    bounds = np.array(bounds, dtype=float).reshape(-1, 2)
+    return bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+
+
 class NoOptimizationEngine:
     def __init__(self, *args):
         pass
@@ -69,6 +79,7 @@ class OneDimensionalOptimizationEngine:
 class MultiDimensionalOptimizationEngine:
     def __init__(self, bounds, x0=None):
         self.bounds = bounds
+        self._bounds_min, self._bounds_span = get_bounds_min_and_span(bounds)
 
         if x0 is not None:
             x0_converted = self.params_to_internal(x0)
@@ -82,20 +93,17 @@ class MultiDimensionalOptimizationEngine:
         )
 
         self._pending = []
-        self._done = []
-        self._results = []
+        # parameters and fitness values of the evaluated candidates of the current
+        # generation; `_n_done` of them are filled
+        self._done = np.empty((self.es.popsize, len(bounds)))
+        self._results = np.empty(self.es.popsize)
+        self._n_done = 0
 
     def params_to_internal(self, parameters):
-        new_parameters = []
-        for [min_, max_], param in zip(self.bounds, parameters):
-            new_parameters.append((param - min_) / (max_ - min_))
-        return new_parameters
+        return list((np.asarray(parameters) - self._bounds_min) / self._bounds_span)
 
     def internal_to_params(self, internal):
-        parameters = []
-        for [min_, max_], param in zip(self.bounds, internal):
-            parameters.append((param * (max_ - min_)) + min_)
-        return parameters
+        return list(self._bounds_min + np.asarray(internal) * self._bounds_span)
 
     def finished(self):
         return self.es.stop()
@@ -107,15 +115,17 @@ class MultiDimensionalOptimizationEngine:
         return self.internal_to_params(self._pending.pop())
 
     def tell(self, fitness, parameters):
-        self._results.append(fitness)
-        self._done.append(parameters)
+        self._results[self._n_done] = fitness
+        self._done[self._n_done] = parameters
+        self._n_done += 1
 
         if not self._pending:
+            n_done, self._n_done = self._n_done, 0
+            # the whole population is converted at once
             self.es.tell(
-                [self.params_to_internal(p) for p in self._done], self._results
+                self.params_to_internal(self._done[:n_done]),
+                list(self._results[:n_done]),
             )
-            self._results = []
-            self._done = []
 
 
 class OptimizerEngine:
@@ -170,6 +180,8 @@ class OptimizerEngine:
             )
             self.bounds.append(ampls)
 
+        self._bounds_min, self._bounds_span = get_bounds_min_and_span(self.bounds)
+
         self.opt = [
             NoOptimizationEngine,
             OneDimensionalOptimizationEngine,
@@ -184,10 +196,9 @@ class OptimizerEngine:
                 param.value = initial
         else:
             new_params = self.opt.ask()
-            new_params_converted = [
-                self.bounds[idx][0] + p * (self.bounds[idx][1] - self.bounds[idx][0])
-                for idx, p in enumerate(new_params)
-            ]
+            new_params_converted = (
+                self._bounds_min + np.asarray(new_params) * self._bounds_span
+            ).tolist()
 
             for param, value in zip(self.to_optimize, new_params_converted):
                 param.value = value
@@ -242,9 +253,12 @@ class OptimizerEngine:
 
             params.optimization_optimized_parameters.value = complete_parameter_set
 
-        print("improvement %d" % (improvement * 100))
-
-        fitness = math.log(1 / optimized_slope)
+        # The slope is NaN if there were too few points between the extrema and may be
+        # zero, which would give an infinite fitness. Both would corrupt the state of
+        # CMA-ES, so the slope is clamped (the comparison is also false for NaN).
+        if not optimized_slope > 1e-30:
+            optimized_slope = 1e-30
+        fitness = -math.log(optimized_slope)
 
         if self.last_parameters_internal is not None:
             self.opt.tell(fitness, self.last_parameters_internal)
@@ -49,7 +49,8 @@ class OptimizeSpectroscopy:
         self.parameters.optimization_failed.value = False
         self.parameters.optimization_approaching.value = True
 
-        spectrum = pickle.loads(spectrum)
+        # convert only once, `spectrum` is used by all of the following steps
+        spectrum = np.asarray(pickle.loads(spectrum))
         cropped = spectrum[x0:x1]
         min_idx = np.argmin(cropped)
         max_idx = np.argmax(cropped)
@@ -90,38 +91,42 @@ class OptimizeSpectroscopy:
         )
 
     def react_to_new_spectrum(self, spectrum):
-        if not self.parameters.optimization_running.value:
+        params = self.parameters
+        if not params.optimization_running.value:
             return
 
         try:
-            params = self.parameters
+            engine = self.engine
 
             dual_channel = params.dual_channel.value
             channel = params.optimization_channel.value
             spectrum_idx = 1 if not dual_channel else (1, 2)[channel]
-            unpickled = pickle.loads(spectrum)
+            unpickled = self.control.load_plot_data(spectrum)
             spectrum = unpickled["error_signal_%d" % spectrum_idx]
             quadrature = unpickled["error_signal_%d_quadrature" % spectrum_idx]
 
-            if self.parameters.optimization_approaching.value:
+            if params.optimization_approaching.value:
                 approaching_finished = self.approacher.approach_line(spectrum)
                 if approaching_finished:
-                    self.parameters.optimization_approaching.value = False
+                    params.optimization_approaching.value = False
             else:
                 self.iteration += 1
+                iteration = self.iteration
 
                 if self.initial_spectrum is None:
-                    params = self.parameters
-                    self.initial_spectrum = spectrum
+                    # The initial spectrum is the reference for every recentering.
+                    # Converting the acquired integer data to float here does that
+                    # conversion only once. It also makes a copy, so the reference
+                    # doesn't alias the plot data shared via `load_plot_data`.
+                    self.initial_spectrum = np.ascontiguousarray(spectrum, dtype=float)
 
-                    self.engine.tell(spectrum, quadrature)
+                    engine.tell(spectrum, quadrature)
 
-                center_line = self.iteration == self.next_recentering_iteration
-                center_line_next_time = (
-                    self.iteration + 1 == self.next_recentering_iteration
-                )
+                next_recentering_iteration = self.next_recentering_iteration
+                center_line = iteration == next_recentering_iteration
+                center_line_next_time = iteration + 1 == next_recentering_iteration
 
-                if self.iteration > 1:
+                if iteration > 1:
                     if center_line:
                         # center the line again
                         shift, _, _2 = determine_shift_by_correlation(
@@ -142,10 +147,10 @@ class OptimizeSpectroscopy:
 
                         self.next_recentering_iteration += self.recenter_after
                     else:
-                        self.engine.tell(spectrum, quadrature)
+                        engine.tell(spectrum, quadrature)
 
-                if not self.engine.finished():
-                    self.engine.request_and_set_new_parameters(
+                if not engine.finished():
+                    engine.request_and_set_new_parameters(
                         use_initial_parameters=center_line_next_time
                     )
                 else:
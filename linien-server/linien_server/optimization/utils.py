@@ -17,7 +17,7 @@
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-from scipy import optimize, stats
+from scipy import optimize
 
 # after the line was centered, its width will be 1/FINAL_ZOOM_FACTOR of the
 # view.
@@ -25,38 +25,63 @@ FINAL_ZOOM_FACTOR = 20
 
 
 def get_max_slope(signal, final_zoom_factor):
-    line_width = len(signal) / final_zoom_factor
+    start, stop = get_center_window(len(signal), final_zoom_factor)
+    return get_slope_between_extrema(signal[start:stop])
+
+
+def get_center_window(length, final_zoom_factor):
+    """
+    Return start and stop index of the window around the center of a signal with
+    `length` points that `get_max_slope` looks at.
+    """
+    line_width = length / final_zoom_factor
     window_width = 1.5 * line_width
-    center = len(signal) / 2
-    range_around_center = [
-        round(center - (window_width / 2)),
-        round(center + (window_width / 2)),
-    ]
-    crop = signal[range_around_center[0] : range_around_center[1]]
+    center = length / 2
+    return round(center - (window_width / 2)), round(center + (window_width / 2))
+
 
+def get_slope_between_extrema(crop):
     idx = list(sorted([np.argmax(crop), np.argmin(crop)]))
 
     crop_of_crop = crop[idx[0] : idx[1]]
 
-    slope, intercept, r_value, p_value, std_err = stats.linregress(
-        list(range(len(crop_of_crop))), crop_of_crop
-    )
-
     # x_diff = np.abs(idx[0] - idx[1])
     # return abs(slope * x_diff)
-    return abs(slope)
+    return abs(get_linear_slope(crop_of_crop))
+
+
+def get_linear_slope(values):
+    """
+    Return the slope of a least-squares fit of a straight line to `values` sampled at
+    0, 1, 2, ... (the same as the slope calculated by `scipy.stats.linregress`).
+    Like `linregress`, NaN is returned if there are less than two values.
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n < 2:
+        return np.nan
+    # As the x values are centered around zero, `y` does not have to be centered and
+    # the sum of squares of the x values is known in closed form.
+    x = np.arange(n, dtype=float) - (n - 1) / 2
+    return np.dot(x, y) / (n * (n * n - 1) / 12)
 
 
 def calculate_spectrum_from_iq(i, q, phase):
-    return np.array(i) * np.cos(phase / 360 * 2 * np.pi) + np.array(q) * np.sin(
-        phase / 360 * 2 * np.pi
-    )
+    phase = np.deg2rad(phase)
+    return np.asarray(i) * np.cos(phase) + np.asarray(q) * np.sin(phase)
 
 
 def optimize_phase_from_iq(i, q, final_zoom_factor):
+    # The window does not depend on the phase, so it is determined only once. As only
+    # the window is of interest, the spectrum is only calculated there. The window is
+    # converted only once instead of for every phase that is tried.
+    start, stop = get_center_window(len(i), final_zoom_factor)
+    i = np.asarray(i[start:stop], dtype=float)
+    q = np.asarray(q[start:stop], dtype=float)
+
     def iq2slope(phase):
         calculated = calculate_spectrum_from_iq(i, q, phase)
-        return get_max_slope(calculated, final_zoom_factor)
+        return get_slope_between_extrema(calculated)
 
     min_result = optimize.minimize_scalar(
         lambda phase: -1 * iq2slope(phase), method="Bounded", bounds=(0, 360)
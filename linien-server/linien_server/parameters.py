@@ -595,26 +595,37 @@ class Parameters:
             if isinstance(param, Parameter):
                 yield name, param
 
-    def init_parameter_sync(
-        self, uuid: str
-    ) -> Iterator[Tuple[str, Any, bool, bool, bool, bool]]:
+    def get_schema(self) -> Iterator[Tuple[str, bool, bool, bool]]:
+        """
+        Yields the names and the properties that don't change at runtime of all
+        parameters. The order is the same as in `init_parameter_values`.
+        """
+        for name, param in self:
+            yield name, param.can_be_cached, param.restorable, param.loggable
+
+    def init_parameter_values(self, uuid: str) -> Iterator[Tuple[Any, bool]]:
         """
-        To be called by a remote client: Yields all parameters as well as their values
-        and if the parameters are suited to be cached registers a listener that pushes
-        changes of these parameters to the client.
+        To be called by a remote client: Yields values and log status of all parameters
+        in the order of `get_schema` and if the parameters are suited to be cached
+        registers a listener that pushes changes of these parameters to the client.
         """
         for name, param in self:
-            yield (
-                name,
-                param.value,
-                param.can_be_cached,
-                param.restorable,
-                param.loggable,
-                param.log,
-            )
+            yield param.value, param.log
             if param.can_be_cached:
                 self.register_remote_listener(uuid, name)
 
+    def init_parameter_sync(
+        self, uuid: str
+    ) -> Iterator[Tuple[str, Any, bool, bool, bool, bool]]:
+        """
+        Like `init_parameter_values` but yields the complete schema along with the
+        values.
+        """
+        for (name, can_be_cached, restorable, loggable), (value, log) in zip(
+            self.get_schema(), self.init_parameter_values(uuid)
+        ):
+            yield name, value, can_be_cached, restorable, loggable, log
+
     def register_remote_listener(self, uuid: str, param_name: str) -> None:
         self._changed_parameters_queue.setdefault(uuid, [])
         self._remote_listener_callbacks.setdefault(uuid, [])
@@ -52,9 +52,16 @@ class Registers:
             from linien_server.acquisition import AcquisitionService
 
             self.acquisition = AcquisitionService()
+            self.acquisition_data = self.acquisition
+            self._acquisition_data_thread = None
         else:
             # AcquisitionService has to be started manually on the Red Pitaya
             self.acquisition = rpyc.connect(host, ACQUISITION_PORT).root
+            # New data is pushed via a callback on a separate connection that is
+            # served in the background, in order not to delay other requests.
+            connection = rpyc.connect(host, ACQUISITION_PORT)
+            self._acquisition_data_thread = rpyc.BgServingThread(connection)
+            self.acquisition_data = connection.root
 
         self._last_sweep_speed = None
         self._last_raw_acquisition_settings = None
@@ -245,8 +252,12 @@ class Registers:
             ),
         )
 
-        for k, v in new.items():
-            self.set(k, int(v))
+        if new:
+            # Send all changed values at once. A tuple is used because rpyc passes it
+            # by value, which matters if the acquisition service runs remotely.
+            self.acquisition.exposed_set_csrs(
+                tuple((k, int(v)) for k, v in new.items())
+            )
 
         if not self.parameters.lock.value and sweep_changed:
             # reset sweep for a short time if the scan range was changed this is needed
@@ -23,15 +23,18 @@ from copy import copy
 from random import randint, random
 from threading import Event, Thread
 from time import sleep
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Set, Tuple, Union
 
 import click
+import msgpack
 import numpy as np
 import rpyc
 from linien_common.common import N_POINTS, check_plot_data, update_signal_history
 from linien_common.communication import (
+    SCALAR_TYPES,
     no_authenticator,
     pack,
+    pack_changed_parameters,
     unpack,
     username_and_password_authenticator,
 )
@@ -60,7 +63,12 @@ class BaseService(rpyc.Service):
         self.parameters = Parameters()
         self.parameters = restore_parameters(self.parameters)
         atexit.register(save_parameters, self.parameters)
+        # The schema (names and static properties of all parameters) is the same for
+        # all clients, so it is serialized only once.
+        self._parameter_schema = msgpack.packb(list(self.parameters.get_schema()))
         self._uuid_mapping = {}  # type: ignore[var-annotated]
+        # uuids of clients that accept msgpack-serialized parameter queues
+        self._msgpack_clients: Set[str] = set()
 
         influxdb_credentials = restore_credentials()
         self.influxdb_logger = InfluxDBLogger(influxdb_credentials, self.parameters)
@@ -74,6 +82,7 @@ class BaseService(rpyc.Service):
     def on_disconnect(self, client) -> None:
         uuid = self._uuid_mapping[client]
         self.parameters.unregister_remote_listeners(uuid)
+        self._msgpack_clients.discard(uuid)
 
     def exposed_get_server_version(self) -> str:
         return __version__
@@ -84,12 +93,41 @@ class BaseService(rpyc.Service):
     def exposed_set_param(self, param_name: str, value: bytes) -> None:
         getattr(self.parameters, param_name).value = unpack(value)
 
+    def exposed_get_param_scalar(
+        self, param_name: str
+    ) -> Union[bool, int, float, bytes]:
+        """
+        Like `exposed_get_param` but doesn't pickle the value if it is a builtin scalar.
+        Other values (e.g. numpy scalars) are pickled as usual.
+        """
+        value = getattr(self.parameters, param_name).value
+        if type(value) in SCALAR_TYPES:
+            return value
+        return pack(value)
+
+    def exposed_set_param_scalar(
+        self, param_name: str, value: Union[bool, int, float]
+    ) -> None:
+        """Like `exposed_set_param` for values that are transferred without pickling."""
+        getattr(self.parameters, param_name).value = value
+
+    def exposed_set_params_bulk(self, values: bytes) -> None:
+        """Set multiple parameters at once from a pickled list of `(name, value)`."""
+        for param_name, value in unpack(values):
+            getattr(self.parameters, param_name).value = value
+
     def exposed_reset_param(self, param_name: str) -> None:
         getattr(self.parameters, param_name).reset()
 
     def exposed_init_parameter_sync(self, uuid: str) -> bytes:
         return pack(list(self.parameters.init_parameter_sync(uuid)))
 
+    def exposed_get_parameter_schema(self) -> bytes:
+        return self._parameter_schema
+
+    def exposed_init_parameter_values(self, uuid: str) -> bytes:
+        return pack(list(self.parameters.init_parameter_values(uuid)))
+
     def exposed_register_remote_listener(self, uuid: str, param_name: str) -> None:
         self.parameters.register_remote_listener(uuid, param_name)
 
@@ -99,8 +137,18 @@ class BaseService(rpyc.Service):
         for param_name in param_names:
             self.exposed_register_remote_listener(uuid, param_name)
 
+    def exposed_enable_msgpack(self, uuid: str) -> None:
+        """
+        Called by clients that are able to decode msgpack-serialized parameter queues,
+        see `linien_common.communication.pack_changed_parameters`.
+        """
+        self._msgpack_clients.add(uuid)
+
     def exposed_get_changed_parameters_queue(self, uuid: str) -> bytes:
-        return pack(self.parameters.get_changed_parameters_queue(uuid))
+        return pack_changed_parameters(
+            self.parameters.get_changed_parameters_queue(uuid),
+            use_msgpack=uuid in self._msgpack_clients,
+        )
 
     def exposed_set_parameter_log(self, param_name: str, value: bool) -> None:
         if getattr(self.parameters, param_name).log != value:
@@ -156,6 +204,13 @@ class RedPitayaControlService(BaseService):
         self.registers = Registers(control=self, parameters=self.parameters, host=host)
         # Connect the acquisition loop to the parameters: Every received value is pushed
         # to `parameters.to_plot`.
+        self._acquired_data: Optional[Tuple[bool, bytes, Optional[float]]] = None
+        self._acquired_data_event = Event()
+        # the data set that was pushed last, both pickled and unpickled
+        self._loaded_plot_data: Tuple[Optional[bytes], Any] = (None, None)
+        self.registers.acquisition_data.exposed_register_data_callback(
+            self._on_acquired_data
+        )
         self.exposed_pause_acquisition()
         self.exposed_continue_acquisition()
 
@@ -186,18 +241,28 @@ class RedPitayaControlService(BaseService):
                     print("further pings will be suppressed")
             sleep(1)
 
+    def _on_acquired_data(
+        self, data_was_raw: bool, data: bytes, data_uuid: Optional[float]
+    ) -> None:
+        # Called from the acquisition thread. Only the latest data set is kept; it is
+        # handled by `_push_acquired_data_to_parameters`.
+        self._acquired_data = (data_was_raw, data, data_uuid)
+        self._acquired_data_event.set()
+
     def _push_acquired_data_to_parameters(self, stop_event: Event):
-        last_hash = None
+        last_processed = None
         while not stop_event.is_set():
-            (
-                new_data_returned,
-                new_hash,
-                data_was_raw,
-                new_data,
-                data_uuid,
-            ) = self.registers.acquisition.exposed_return_data(last_hash)
-            if new_data_returned:
-                last_hash = new_hash
+            # the timeout is only needed for checking `stop_event` regularly
+            if not self._acquired_data_event.wait(0.1):
+                continue
+            self._acquired_data_event.clear()
+            acquired_data = self._acquired_data
+            # new data may have arrived between the previous `clear()` and reading it,
+            # in which case it was already processed in the previous iteration
+            if acquired_data is last_processed:
+                continue
+            last_processed = acquired_data
+            data_was_raw, new_data, data_uuid = acquired_data  # type: ignore
             # When a parameter is changed, `pause_acquisition` is set. This means that
             # the we should skip new data until we are sure that it was recorded with
             # the new settings.
@@ -214,6 +279,7 @@ class RedPitayaControlService(BaseService):
                         print("incorrect data received for lock state, ignoring!")
                         continue
 
+                    self._loaded_plot_data = (new_data, data_loaded)
                     self.parameters.to_plot.value = new_data
 
                     # generate signal stats
@@ -237,7 +303,17 @@ class RedPitayaControlService(BaseService):
                     )
                 else:
                     self.parameters.acquisition_raw_data.value = new_data
-            sleep(0.05)
+
+    def load_plot_data(self, plot_data: bytes) -> Any:
+        """
+        Unpickle a value of `parameters.to_plot`. The data pushed last was already
+        unpickled by the data pusher and is returned without unpickling it again, so
+        it must not be modified.
+        """
+        pushed_data, loaded_data = self._loaded_plot_data
+        if plot_data is pushed_data:
+            return loaded_data
+        return pickle.loads(plot_data)
 
     def _task_running(self):
         return (
@@ -0,0 +1,39 @@
+# Copyright 2023 Bastian Leykauf <leykauf@physik.hu-berlin.de>
+#
+# This file is part of Linien and based on redpid.
+#
+# Linien is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linien is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linien.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+
+import numpy as np
+
+from gateware.bit2bin import flip32
+
+RNG = np.random.default_rng(seed=0)
+
+
+def test_flip32():
+    assert (
+        flip32(b"\x01\x02\x03\x04\x05\x06\x07\x08")
+        == b"\x04\x03\x02\x01\x08\x07\x06\x05"
+    )
+
+    data = RNG.integers(0, 256, 4096, dtype=np.uint8).tobytes()
+    words = struct.unpack("<1024I", data)
+    assert flip32(data) == struct.pack(">1024I", *words)
+
+
+if __name__ == "__main__":
+    test_flip32()
@@ -0,0 +1,127 @@
+# Copyright 2023 Bastian Leykauf <leykauf@physik.hu-berlin.de>
+#
+# This file is part of Linien and based on redpid.
+#
+# Linien is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linien is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linien.  If not, see <http://www.gnu.org/licenses/>.
+
+import pickle
+
+from linien_client.remote_parameters import RemoteParameter, RemoteParameters
+from linien_common.common import AutolockMode
+from linien_common.communication import (
+    pack_changed_parameters,
+    unpack,
+    unpack_changed_parameters,
+)
+from pytest import raises
+
+
+class RecordingRemote:
+    """Stands in for the server and records which values were set how."""
+
+    def __init__(self):
+        self.calls = []
+
+    def exposed_set_param(self, name, value):
+        self.calls.append(("single", [(name, unpack(value))]))
+
+    def exposed_set_param_scalar(self, name, value):
+        self.calls.append(("single", [(name, value)]))
+
+    def exposed_set_params_bulk(self, values):
+        self.calls.append(("bulk", unpack(values)))
+
+    def exposed_set_parameter_log(self, name, value):
+        pass
+
+
+def make_remote_parameters(remote, names):
+    # bypasses `__init__` which requires an rpyc connection
+    parameters = object.__new__(RemoteParameters)
+    parameters.remote = remote
+    parameters._batch_buffer = None
+    for name in names:
+        param = RemoteParameter(
+            parameters,
+            name,
+            use_cache=False,
+            restorable=False,
+            loggable=False,
+            log=False,
+        )
+        setattr(parameters, name, param)
+    return parameters
+
+
+def test_changed_parameters_queue():
+    queue = [("sweep_speed", 8), ("lock", True), ("to_plot", b"\x80data")]
+
+    packed = pack_changed_parameters(queue, use_msgpack=True)
+    assert packed[:1] != pickle.PROTO
+    assert unpack_changed_parameters(packed) == queue
+
+    # dicts with non-str keys
+    queue = [("stats", {1: 2.0, "a": {3.5: [4]}})]
+    packed = pack_changed_parameters(queue, use_msgpack=True)
+    assert packed[:1] != pickle.PROTO
+    assert unpack_changed_parameters(packed) == queue
+
+    # values that msgpack can't represent exactly fall back to pickle
+    queue = [("autolock_mode", AutolockMode.ROBUST), ("idxs", (1, 2))]
+    packed = pack_changed_parameters(queue, use_msgpack=True)
+    assert packed[:1] == pickle.PROTO
+    unpacked = unpack_changed_parameters(packed)
+    assert unpacked == queue
+    assert isinstance(unpacked[0][1], AutolockMode)
+
+    queue = [("sweep_speed", 8)]
+    packed = pack_changed_parameters(queue, use_msgpack=False)
+    assert unpack_changed_parameters(packed) == queue
+
+
+def test_batch():
+    remote = RecordingRemote()
+    parameters = make_remote_parameters(remote, ["a", "b"])
+
+    parameters.a.value = 1
+    assert remote.calls == [("single", [("a", 1)])]
+
+    # nested blocks send all changes in their order when the outermost block is left
+    remote.calls.clear()
+    with parameters.batch():
+        parameters.b.value = 2
+        with parameters.batch():
+            parameters.a.value = 3
+        assert remote.calls == []
+        parameters.b.value = 4
+    assert remote.calls == [("bulk", [("b", 2), ("a", 3), ("b", 4)])]
+
+    # changes are discarded if the block raises
+    remote.calls.clear()
+    with raises(RuntimeError):
+        with parameters.batch():
+            parameters.a.value = 5
+            raise RuntimeError()
+    assert remote.calls == []
+
+    # afterwards, values are sent directly again; empty blocks send nothing
+    with parameters.batch():
+        pass
+    parameters.b.value = 6
+    assert remote.calls == [("single", [("b", 6)])]
+
+
+if __name__ == "__main__":
+    test_changed_parameters_queue()
+    test_batch()
@@ -17,8 +17,13 @@
 # along with Linien.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-from linien_server.optimization.utils import get_max_slope, optimize_phase_from_iq
+from linien_server.optimization.utils import (
+    get_linear_slope,
+    get_max_slope,
+    optimize_phase_from_iq,
+)
 from scipy.optimize import minimize_scalar
+from scipy.stats import linregress
 
 RNG = np.random.default_rng(seed=0)
 
@@ -45,6 +50,17 @@ def test_get_max_slope():
     assert get_max_slope(i, 10) == 2.0
 
 
+def test_get_linear_slope():
+    for n in (2, 3, 100, 1001):
+        values = RNG.normal(size=n) * 1000
+        expected = linregress(list(range(n)), values).slope
+        assert np.isclose(get_linear_slope(values), expected)
+
+    # too few values for a fit, as happens if minimum and maximum are adjacent
+    assert np.isnan(get_linear_slope([5.0]))
+    assert np.isnan(get_linear_slope([]))
+
+
 def test_iq():
     Y_SHIFT = 0
 
@@ -114,4 +130,5 @@ def test_iq():
 
 if __name__ == "__main__":
     test_get_max_slope()
+    test_get_linear_slope()
     test_iq()